@@ -7,12 +7,32 @@ of sequences at specified positions.
 """
 
 import argparse
+import array
+import bisect
+import concurrent.futures
+import functools
+import itertools
+import mmap
+import os
 import re
 import sys
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Iterator, Optional, Sequence
+
+
+class AtlasWriterError(ValueError):
+    """Raised when input, a segment selection, or a sequence operation is invalid."""
 
 
 class AtlasWriter:
+    # Position information in a segment header (e.g., MZ242719.1:1-290)
+    _HEADER_RE = re.compile(r'([^:]+):(\d+)-(\d+)')
+    
+    # Bases accepted in segment sequences
+    _ALLOWED_BASES = b'ACGTUNacgtun'
+    
+    # Line breaks and other whitespace removed from mapped sequence records
+    _WHITESPACE = b' \t\n\r\x0b\x0c'
+    
     def __init__(self, fasta_file: str):
         """
         Initialize the AtlasWriter with a FASTA file containing locus segments.
@@ -21,64 +41,154 @@ class AtlasWriter:
             fasta_file: Path to the FASTA file containing locus segments
         """
         self.fasta_file = fasta_file
-        self.segments = []
-        self.segment_data = {}
+        self.segment_data: Dict[int, Dict] = {}
         self.load_segments()
     
+    @property
+    def segments(self) -> List[Tuple[int, str, int, int, str, bytes]]:
+        """
+        Segments as (index, accession, start, end, header, sequence) tuples sorted by start.
+        
+        Built on demand from segment_data, which is the only stored copy.
+        """
+        return sorted(
+            ((i, seg['accession'], seg['start'], seg['end'], seg['header'], seg['sequence'])
+             for i, seg in self.segment_data.items()),
+            key=lambda x: x[2]
+        )
+    
+    def _iter_fasta(self, fh):
+        """
+        Stream (header, sequence) pairs from an open FASTA file handle.
+        
+        Args:
+            fh: An open binary-mode file handle
+            
+        Yields:
+            Tuples of (header, sequence) with the leading '>' and line breaks removed.
+            The header is decoded to str; the sequence is kept as bytes.
+        """
+        title = None
+        chunks = []
+        for line in fh:
+            if line[:1] == b'>':
+                if title is not None:
+                    yield title, b''.join(chunks)
+                title = line[1:].rstrip().decode()
+                chunks = []
+            else:
+                chunks.append(line.rstrip())
+        
+        if title is not None:
+            yield title, b''.join(chunks)
+    
+    def _iter_fasta_mmap(self, mm: mmap.mmap) -> Iterator[Tuple[str, bytes]]:
+        """
+        Scan (header, sequence) pairs from a memory-mapped FASTA file.
+        
+        Records are located with mmap.find on '\\n>' so the file is never read
+        line by line or copied as a whole.
+        
+        Args:
+            mm: A read-only memory map of the FASTA file
+            
+        Yields:
+            Tuples of (header, sequence) with the leading '>' and whitespace removed.
+            The header is decoded to str; the sequence is kept as bytes.
+        """
+        size = len(mm)
+        
+        # Skip anything before the first header line
+        if mm[:1] == b'>':
+            pos = 0
+        else:
+            pos = mm.find(b'\n>')
+            if pos < 0:
+                return
+            pos += 1
+        
+        while pos < size:
+            nxt = mm.find(b'\n>', pos)
+            end = size if nxt < 0 else nxt + 1
+            
+            header_end = mm.find(b'\n', pos, end)
+            if header_end < 0:
+                header_end = end
+            
+            header = mm[pos + 1:header_end].rstrip().decode()
+            sequence = mm[header_end + 1:end].translate(None, self._WHITESPACE)
+            yield header, sequence
+            
+            pos = end
+    
     def load_segments(self) -> None:
         """Load and parse the locus segments from the FASTA file."""
         try:
-            with open(self.fasta_file, 'r') as file:
-                content = file.read()
-                
-            # Extract header and sequence pairs from the FASTA file
-            entries = re.findall(r'(>.+?\n)([^>]+)', content, re.DOTALL)
-            
-            for i, (header, sequence) in enumerate(entries, 1):
-                # Clean up header and sequence
-                header = header.strip()
-                sequence = sequence.replace('\n', '').strip()
+            with open(self.fasta_file, 'rb', buffering=1 << 20) as file:
+                try:
+                    mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty files and non-regular files (e.g. pipes) cannot be mapped
+                    mm = None
                 
-                # Extract position information from header (e.g., MZ242719.1:1-290)
-                match = re.search(r'([^:]+):(\d+)-(\d+)', header)
-                if match:
-                    accession = match.group(1)
-                    start = int(match.group(2))
-                    end = int(match.group(3))
-                    
-                    # Store segment information
-                    self.segments.append((i, accession, start, end, header, sequence))
-                    self.segment_data[i] = {
-                        'accession': accession,
-                        'start': start,
-                        'end': end,
-                        'header': header,
-                        'sequence': sequence
-                    }
-                else:
-                    print(f"Warning: Could not parse position information from header: {header}")
-            
-            # Sort segments by start position
-            self.segments.sort(key=lambda x: x[2])
+                records = self._iter_fasta_mmap(mm) if mm is not None else self._iter_fasta(file)
+                try:
+                    self._store_segments(records)
+                finally:
+                    if mm is not None:
+                        mm.close()
             
-            print(f"Loaded {len(self.segments)} locus segments from {self.fasta_file}")
+            print(f"Loaded {len(self.segment_data)} locus segments from {self.fasta_file}")
         
+        except AtlasWriterError:
+            raise
         except FileNotFoundError:
-            sys.exit(f"Error: FASTA file '{self.fasta_file}' not found")
+            raise AtlasWriterError(f"Error: FASTA file '{self.fasta_file}' not found")
         except Exception as e:
-            sys.exit(f"Error loading FASTA file: {str(e)}")
+            raise AtlasWriterError(f"Error loading FASTA file: {str(e)}")
+    
+    def _store_segments(self, records: Iterator[Tuple[str, bytes]]) -> None:
+        """
+        Validate parsed FASTA records and store them in segment_data.
+        
+        Args:
+            records: Iterator of (header, sequence) pairs in file order
+        """
+        for i, (header, sequence) in enumerate(records, 1):
+            # Reject sequences containing anything other than the allowed bases
+            if sequence.translate(None, self._ALLOWED_BASES):
+                raise AtlasWriterError(f"Error: Invalid base in segment {i} ({header})")
+            
+            # Extract position information from header (e.g., MZ242719.1:1-290)
+            match = self._HEADER_RE.match(header)
+            if match:
+                accession = match.group(1)
+                start = int(match.group(2))
+                end = int(match.group(3))
+                
+                # Store segment information
+                self.segment_data[i] = {
+                    'accession': accession,
+                    'acc_base': accession.partition('.')[0],
+                    'start': start,
+                    'end': end,
+                    'header': header,
+                    'sequence': sequence
+                }
+            else:
+                print(f"Warning: Could not parse position information from header: {header}")
     
-    def parse_segment_selection(self, selection: str) -> List[int]:
+    def parse_segment_intervals(self, selection: str) -> List[Tuple[int, int]]:
         """
-        Parse a segment selection string into a list of segment indices.
+        Parse a segment selection string into merged, disjoint index intervals.
         
         Args:
             selection: A string like "1,2,3,4,5" or "1-5,7,9-11"
             
         Returns:
-            A list of segment indices
+            A sorted list of inclusive (first, last) segment index pairs
         """
-        selected_indices = []
+        intervals = []
         
         # Split the selection string by commas
         parts = selection.split(',')
@@ -88,25 +198,93 @@ class AtlasWriter:
                 # Handle ranges (e.g., "1-5")
                 try:
                     start, end = map(int, part.split('-'))
-                    if start < 1 or end > len(self.segments) or start > end:
+                    if start < 1 or end > len(self.segment_data) or start > end:
                         raise ValueError(f"Invalid range: {part}")
-                    selected_indices.extend(range(start, end + 1))
+                    intervals.append((start, end))
                 except ValueError:
-                    sys.exit(f"Error: Invalid range format in '{part}'")
+                    raise AtlasWriterError(f"Error: Invalid range format in '{part}'")
             else:
                 # Handle single indices
                 try:
                     index = int(part)
-                    if index < 1 or index > len(self.segments):
+                    if index < 1 or index > len(self.segment_data):
                         raise ValueError(f"Invalid segment index: {index}")
-                    selected_indices.append(index)
+                    intervals.append((index, index))
                 except ValueError:
-                    sys.exit(f"Error: Invalid segment index: {part}")
+                    raise AtlasWriterError(f"Error: Invalid segment index: {part}")
+        
+        # Merge overlapping and adjacent intervals
+        intervals.sort()
+        merged = []
+        for start, end in intervals:
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        
+        return merged
+    
+    def parse_segment_selection(self, selection: str) -> Sequence[int]:
+        """
+        Parse a segment selection string into a sequence of segment indices.
+        
+        Args:
+            selection: A string like "1,2,3,4,5" or "1-5,7,9-11"
+            
+        Returns:
+            The sorted unique segment indices, as a range when the selection is
+            contiguous and as a list otherwise
+        """
+        intervals = self.parse_segment_intervals(selection)
+        
+        # A contiguous selection needs no per-index storage
+        if len(intervals) == 1:
+            start, end = intervals[0]
+            return range(start, end + 1)
+        
+        return list(itertools.chain.from_iterable(range(start, end + 1) for start, end in intervals))
+    
+    def segment_offsets(self, selected_indices: Sequence[int]) -> Tuple[Sequence[int], Dict[int, int]]:
+        """
+        Compute prefix sums of the selected segment lengths.
+        
+        Args:
+            selected_indices: Sorted selected segment indices
+            
+        Returns:
+            A tuple of (cum, pos_of) where cum[j] is the combined length of the first j
+            selected segments (stored unboxed in an array) and pos_of maps a segment
+            index to its position j
+        """
+        seg_lens = (len(self.segment_data[i]['sequence']) for i in selected_indices)
+        cum = array.array('q', [0])
+        cum.extend(itertools.accumulate(seg_lens))
+        pos_of = {i: j for j, i in enumerate(selected_indices)}
         
-        # Remove duplicates and sort
-        return sorted(set(selected_indices))
+        return cum, pos_of
     
-    def parse_truncation(self, truncation: str, selected_indices: List[int]) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_segment_position(spec: str) -> Tuple[int, int]:
+        """
+        Parse a "segment:position" string into a pair of integers.
+        
+        Args:
+            spec: A string like "3:150"
+            
+        Returns:
+            A tuple of (segment, position)
+            
+        Raises:
+            ValueError: If the string is not two colon-separated integers
+        """
+        segment, position = map(int, spec.split(':'))
+        return segment, position
+    
+    def parse_truncation(self, truncation: str, selected_indices: Sequence[int],
+                         cum: Optional[Sequence[int]] = None,
+                         pos_of: Optional[Dict[int, int]] = None) -> Tuple[Optional[int], Optional[int], Optional[int]]:
         """
         Parse a truncation string to determine start and end positions.
         
@@ -114,7 +292,9 @@ class AtlasWriter:
             truncation: A string specifying where to truncate the sequence
                 - For a range: "upstream_segment:upstream_base-downstream_segment:downstream_base"
                 - For a single cut: "segment:position/downstream_base"
-            selected_indices: List of selected segment indices
+            selected_indices: Sequence of selected segment indices
+            cum: Optional prefix sums of selected segment lengths (see segment_offsets)
+            pos_of: Optional map from segment index to its position in selected_indices
             
         Returns:
             A tuple of (global_start, global_end, poly_a_count)
@@ -122,6 +302,9 @@ class AtlasWriter:
         if not truncation:
             return None, None, None
         
+        if cum is None or pos_of is None:
+            cum, pos_of = self.segment_offsets(selected_indices)
+        
         # Check for polyA specification
         poly_a_count = None
         
@@ -130,74 +313,81 @@ class AtlasWriter:
             try:
                 start_spec, end_spec = truncation.split('-')
                 
-                start_segment, start_pos = map(int, start_spec.split(':'))
-                end_segment, end_pos = map(int, end_spec.split(':'))
+                start_segment, start_pos = self._parse_segment_position(start_spec)
+                end_segment, end_pos = self._parse_segment_position(end_spec)
                 
-                if start_segment not in selected_indices or end_segment not in selected_indices:
-                    sys.exit(f"Error: Truncation segments must be included in the selected segments")
+                if start_segment not in pos_of or end_segment not in pos_of:
+                    raise AtlasWriterError(f"Error: Truncation segments must be included in the selected segments")
                 
                 # Calculate global positions
-                global_start = sum(len(self.segment_data[i]['sequence']) for i in selected_indices 
-                                  if i < start_segment)
+                global_start = cum[pos_of[start_segment]]
                 global_start += start_pos - 1  # Convert to 0-based index (keep the base at start_pos)
                 
-                global_end = sum(len(self.segment_data[i]['sequence']) for i in selected_indices 
-                                if i < end_segment)
+                global_end = cum[pos_of[end_segment]]
                 global_end += end_pos  # Include the base at end_pos
                 
                 return global_start, global_end, poly_a_count
             
+            except AtlasWriterError:
+                raise
             except ValueError:
-                sys.exit(f"Error: Invalid truncation format. Use 'upstream_segment:upstream_base-downstream_segment:downstream_base'")
+                raise AtlasWriterError(f"Error: Invalid truncation format. Use 'upstream_segment:upstream_base-downstream_segment:downstream_base'")
         elif "/" in truncation:
             # Handle single position truncation with explicit upstream/downstream specification
             try:
-                segment_pos_part = truncation.split('/')[0]
-                poly_a_part = truncation.split('/')[1] if len(truncation.split('/')) > 1 else None
+                parts = truncation.split('/')
+                segment_pos_part = parts[0]
+                poly_a_part = parts[1] if len(parts) > 1 else None
                 
-                segment, position = map(int, segment_pos_part.split(':'))
+                segment, position = self._parse_segment_position(segment_pos_part)
                 
                 if poly_a_part and poly_a_part.isdigit():
                     poly_a_count = int(poly_a_part)
                 
-                if segment not in selected_indices:
-                    sys.exit(f"Error: Truncation segment must be included in the selected segments")
+                if segment not in pos_of:
+                    raise AtlasWriterError(f"Error: Truncation segment must be included in the selected segments")
                 
                 # Calculate global position
-                global_pos = sum(len(self.segment_data[i]['sequence']) for i in selected_indices 
-                                if i < segment)
+                global_pos = cum[pos_of[segment]]
                 global_pos += position  # This is the position AFTER which we'll cut
                 
                 return None, global_pos, poly_a_count  # Truncate up to this position
             
+            except AtlasWriterError:
+                raise
             except ValueError:
-                sys.exit(f"Error: Invalid truncation format. Use 'segment:position'")
+                raise AtlasWriterError(f"Error: Invalid truncation format. Use 'segment:position'")
         else:
             # Backward compatibility for segment:position format
             try:
-                segment, position = map(int, truncation.split(':'))
+                segment, position = self._parse_segment_position(truncation)
                 
-                if segment not in selected_indices:
-                    sys.exit(f"Error: Truncation segment must be included in the selected segments")
+                if segment not in pos_of:
+                    raise AtlasWriterError(f"Error: Truncation segment must be included in the selected segments")
                 
                 # Calculate global position
-                global_pos = sum(len(self.segment_data[i]['sequence']) for i in selected_indices 
-                                if i < segment)
+                global_pos = cum[pos_of[segment]]
                 global_pos += position
                 
                 print(f"Warning: Deprecated truncation format. Consider using 'segment:position/' for clarity.")
                 return None, global_pos, poly_a_count  # Truncate up to this position
             
+            except AtlasWriterError:
+                raise
             except ValueError:
-                sys.exit(f"Error: Invalid truncation format. Use 'segment:position/' or 'upstream_segment:upstream_base-downstream_segment:downstream_base'")
+                raise AtlasWriterError(f"Error: Invalid truncation format. Use 'segment:position/' or 'upstream_segment:upstream_base-downstream_segment:downstream_base'")
     
-    def parse_poly_a(self, poly_a: str, selected_indices: List[int]) -> Tuple[Optional[int], Optional[int]]:
+    def parse_poly_a(self, poly_a: str, selected_indices: Sequence[int],
+                     cum: Optional[Sequence[int]] = None,
+                     pos_of: Optional[Dict[int, int]] = None) -> Tuple[Optional[int], Optional[int]]:
         """
         Parse a polyA string to determine position and count.
         
         Args:
             poly_a: A string like "segment:position/count" or "position/count"
-            selected_indices: List of selected segment indices
+            selected_indices: Sequence of selected segment indices
+            cum: Optional prefix sums of selected segment lengths (see segment_offsets)
+            pos_of: Optional map from segment index to its position in selected_indices
             
         Returns:
             A tuple of (global_position, count)
@@ -205,6 +395,9 @@ class AtlasWriter:
         if not poly_a:
             return None, None
         
+        if cum is None or pos_of is None:
+            cum, pos_of = self.segment_offsets(selected_indices)
+        
         try:
             if "/" in poly_a:
                 position_part, count_str = poly_a.split("/")
@@ -212,91 +405,81 @@ class AtlasWriter:
                 
                 # Check if format is segment:position or just a global position
                 if ":" in position_part:
-                    segment, position = map(int, position_part.split(':'))
+                    segment, position = self._parse_segment_position(position_part)
                     
-                    if segment not in selected_indices:
-                        sys.exit(f"Error: PolyA segment must be included in the selected segments")
+                    if segment not in pos_of:
+                        raise AtlasWriterError(f"Error: PolyA segment must be included in the selected segments")
                     
                     # Check if position is valid for the specified segment
-                    if position > len(self.segment_data[segment]['sequence']):
-                        sys.exit(f"Error: Position {position} is beyond the length of segment {segment} (length: {len(self.segment_data[segment]['sequence'])})")
+                    seg_length = cum[pos_of[segment] + 1] - cum[pos_of[segment]]
+                    if position > seg_length:
+                        raise AtlasWriterError(f"Error: Position {position} is beyond the length of segment {segment} (length: {seg_length})")
                     
                     # Calculate the correct global position by summing only selected segments
-                    global_pos = 0
-                    for idx in selected_indices:
-                        if idx < segment:
-                            global_pos += len(self.segment_data[idx]['sequence'])
-                        elif idx == segment:
-                            global_pos += position
-                            break
+                    global_pos = cum[pos_of[segment]] + position
                 else:
                     # Treat as a global position directly
                     global_pos = int(position_part)
                 
                 return global_pos, count
             else:
-                sys.exit(f"Error: Invalid polyA format. Use 'segment:position/count' or 'position/count'")
+                raise AtlasWriterError(f"Error: Invalid polyA format. Use 'segment:position/count' or 'position/count'")
+        except AtlasWriterError:
+            raise
         except ValueError:
-            sys.exit(f"Error: Invalid polyA format. Use 'segment:position/count' or 'position/count'")
+            raise AtlasWriterError(f"Error: Invalid polyA format. Use 'segment:position/count' or 'position/count'")
     
-    def combine_segments(self, indices: List[int], 
+    def combine_segments(self, indices: Sequence[int], 
                          global_start: Optional[int] = None, 
                          global_end: Optional[int] = None,
                          poly_a_pos: Optional[int] = None,
-                         poly_a_count: Optional[int] = None) -> Tuple[str, str]:
+                         poly_a_count: Optional[int] = None) -> Tuple[str, bytes]:
         """
         Combine selected segments into a single sequence, with optional truncation and polyA addition.
         
         Args:
-            indices: List of segment indices to combine
+            indices: Sequence of segment indices to combine
             global_start: Optional starting position for truncation (inclusive)
             global_end: Optional ending position for truncation (exclusive)
             poly_a_pos: Optional position to add polyA tail
             poly_a_count: Optional number of A's to add
             
         Returns:
-            A tuple of (header, sequence)
+            A tuple of (header, sequence), with the sequence as bytes
         """
         if not indices:
-            sys.exit("Error: No segments selected")
+            raise AtlasWriterError("Error: No segments selected")
         
         # Get the first and last segments for header information
         first_segment = self.segment_data[indices[0]]
         last_segment = self.segment_data[indices[-1]]
         
         # Create a new header
-        accession = first_segment['accession'].split('.')[0]
+        accession = first_segment['acc_base']
         start_pos = first_segment['start']
         end_pos = last_segment['end']
         
         # Combine sequences
-        combined_sequence = ''
-        for idx in indices:
-            combined_sequence += self.segment_data[idx]['sequence']
+        combined_sequence = b''.join([self.segment_data[idx]['sequence'] for idx in indices])
+        cum, _ = self.segment_offsets(indices)
+        combined_length = cum[-1]
         
         # Apply truncation if specified
         truncated_sequence = combined_sequence
         if global_start is not None or global_end is not None:
             start_idx = global_start if global_start is not None else 0
-            end_idx = global_end if global_end is not None else len(combined_sequence)
+            end_idx = global_end if global_end is not None else combined_length
             
-            if start_idx < 0 or end_idx > len(combined_sequence) or start_idx >= end_idx:
-                sys.exit(f"Error: Invalid truncation range: {start_idx}-{end_idx}")
+            if start_idx < 0 or end_idx > combined_length or start_idx >= end_idx:
+                raise AtlasWriterError(f"Error: Invalid truncation range: {start_idx}-{end_idx}")
             
             truncated_sequence = combined_sequence[start_idx:end_idx]
             
             # Update the positions in the header
             if global_start is not None:
-                segment_idx = 0
-                cumulative_length = 0
-                
                 # Find which segment contains the start position
-                for i, idx in enumerate(indices):
-                    seg_length = len(self.segment_data[idx]['sequence'])
-                    if cumulative_length + seg_length > global_start:
-                        segment_idx = i
-                        break
-                    cumulative_length += seg_length
+                segment_idx = bisect.bisect_right(cum, global_start) - 1
+                cumulative_length = cum[segment_idx]
                 
                 # Calculate the new start position
                 start_seg = self.segment_data[indices[segment_idx]]
@@ -304,16 +487,9 @@ class AtlasWriter:
                 start_pos = start_seg['start'] + relative_pos
             
             if global_end is not None:
-                segment_idx = 0
-                cumulative_length = 0
-                
                 # Find which segment contains the end position
-                for i, idx in enumerate(indices):
-                    seg_length = len(self.segment_data[idx]['sequence'])
-                    if cumulative_length + seg_length >= global_end:
-                        segment_idx = i
-                        break
-                    cumulative_length += seg_length
+                segment_idx = bisect.bisect_left(cum, global_end) - 1
+                cumulative_length = cum[segment_idx]
                 
                 # Calculate the new end position
                 end_seg = self.segment_data[indices[segment_idx]]
@@ -329,9 +505,11 @@ class AtlasWriter:
         final_sequence = truncated_sequence
         if poly_a_pos is not None and poly_a_count is not None:
             if poly_a_pos > len(truncated_sequence):
-                sys.exit(f"Error: PolyA position {poly_a_pos} is beyond the length of the combined sequence {len(truncated_sequence)}")
+                raise AtlasWriterError(f"Error: PolyA position {poly_a_pos} is beyond the length of the combined sequence {len(truncated_sequence)}")
             
-            final_sequence = truncated_sequence[:poly_a_pos] + 'A' * poly_a_count
+            # Pad the kept prefix with A's in a single allocation of the final length
+            prefix = truncated_sequence[:poly_a_pos]
+            final_sequence = prefix.ljust(len(prefix) + poly_a_count, b'A')
             description += f" (with {poly_a_count} polyA tail)"
         else:
             final_sequence = truncated_sequence
@@ -340,28 +518,58 @@ class AtlasWriter:
         
         return header, final_sequence
     
-    def format_fasta(self, header: str, sequence: str, width: int = 70) -> str:
+    def combine_many(self, specs: List[Dict], max_workers: Optional[int] = None) -> List[Tuple[str, bytes]]:
         """
-        Format a sequence as FASTA with specified line width.
+        Run combine_segments for many specifications against the loaded segments in parallel.
+        
+        Args:
+            specs: List of keyword-argument dicts for combine_segments
+                (e.g., {'indices': range(1, 6), 'global_end': 500})
+            max_workers: Optional number of worker threads (defaults to the CPU count)
+            
+        Returns:
+            A list of (header, sequence) tuples in the same order as specs
+        """
+        if not specs:
+            return []
+        
+        workers = max_workers or os.cpu_count() or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(specs))) as executor:
+            return list(executor.map(lambda spec: self.combine_segments(**spec), specs))
+    
+    def _iter_fasta_bytes(self, header: str, sequence: bytes, width: int = 70) -> Iterator[bytes]:
+        """
+        Stream a sequence as FASTA with specified line width.
         
         Args:
             header: The FASTA header
             sequence: The sequence to format
             width: Line width for the sequence
             
-        Returns:
-            Formatted FASTA string
+        Yields:
+            The header line followed by each sequence line, newline-terminated
         """
-        # Add header
-        fasta = header + '\n'
+        yield header.encode() + b'\n'
         
-        # Add sequence with specified line width
-        for i in range(0, len(sequence), width):
-            fasta += sequence[i:i+width] + '\n'
+        view = memoryview(sequence)
+        for i in range(0, len(view), width):
+            yield view[i:i + width].tobytes() + b'\n'
+    
+    def format_fasta(self, header: str, sequence: bytes, width: int = 70) -> bytes:
+        """
+        Format a sequence as FASTA with specified line width.
         
-        return fasta
+        Args:
+            header: The FASTA header
+            sequence: The sequence to format
+            width: Line width for the sequence
+            
+        Returns:
+            Formatted FASTA bytes
+        """
+        return b''.join(self._iter_fasta_bytes(header, sequence, width))
     
-    def write_output(self, header: str, sequence: str, output_file: Optional[str] = None) -> None:
+    def write_output(self, header: str, sequence: bytes, output_file: Optional[str] = None) -> None:
         """
         Write the formatted FASTA output to a file or stdout.
         
@@ -370,24 +578,40 @@ class AtlasWriter:
             sequence: The sequence to write
             output_file: Optional file path for output
         """
-        formatted_fasta = self.format_fasta(header, sequence)
-        
         if output_file:
             try:
-                with open(output_file, 'w') as file:
-                    file.write(formatted_fasta)
+                with open(output_file, 'wb') as file:
+                    for chunk in self._iter_fasta_bytes(header, sequence):
+                        file.write(chunk)
                 print(f"Output written to {output_file}")
             except Exception as e:
-                sys.exit(f"Error writing to file: {str(e)}")
+                raise AtlasWriterError(f"Error writing to file: {str(e)}")
         else:
-            print(formatted_fasta)
+            # Flush pending text output before writing to the underlying binary buffer
+            sys.stdout.flush()
+            for chunk in self._iter_fasta_bytes(header, sequence):
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
     
     def print_segment_info(self) -> None:
-        """Print information about available segments."""
-        print("\nAvailable Locus Segments:")
-        print("-" * 80)
-        print(f"{'Index':^5} | {'Accession':^10} | {'Range':^15} | {'Length':^8} | {'Description'}")
-        print("-" * 80)
+        """
+        Print information about available segments.
+        
+        An aligned table is printed when stdout is a terminal; otherwise the
+        segments are written as tab-separated values.
+        """
+        is_tty = sys.stdout.isatty()
+        
+        if is_tty:
+            rows = [
+                "",
+                "Available Locus Segments:",
+                "-" * 80,
+                f"{'Index':^5} | {'Accession':^10} | {'Range':^15} | {'Length':^8} | {'Description'}",
+                "-" * 80,
+            ]
+        else:
+            rows = ["Index\tAccession\tStart\tEnd\tLength\tDescription"]
         
         for idx, segment in sorted(self.segment_data.items()):
             accession = segment['accession']
@@ -397,9 +621,16 @@ class AtlasWriter:
             
             # Extract description from header if available
             header = segment['header']
-            description = header.split(' ', 1)[1] if ' ' in header else "No description"
+            _, sep, description = header.partition(' ')
+            if not sep:
+                description = "No description"
             
-            print(f"{idx:^5} | {accession:^10} | {start:^7}-{end:^7} | {length:^8} | {description}")
+            if is_tty:
+                rows.append(f"{idx:^5} | {accession:^10} | {start:^7}-{end:^7} | {length:^8} | {description}")
+            else:
+                rows.append(f"{idx}\t{accession}\t{start}\t{end}\t{length}\t{description}")
+        
+        sys.stdout.write("\n".join(rows) + "\n")
 
 
 def main():
@@ -453,40 +684,45 @@ Examples:
     
     args = parser.parse_args()
     
-    # Initialize AtlasWriter
-    atlas = AtlasWriter(args.input)
-    
-    # If --list flag is provided, print segment info and exit
-    if args.list:
-        atlas.print_segment_info()
-        return
-    
-    # Check if segment selection is provided
-    if not args.include_locus_segment:
-        sys.exit("Error: No segment selection provided. Use --include_locus_segment or --list")
-    
-    # Parse segment selection
-    selected_indices = atlas.parse_segment_selection(args.include_locus_segment)
-    
-    # Parse truncation if provided
-    global_start, global_end, poly_a_count_from_truncate = None, None, None
-    if args.truncate:
-        global_start, global_end, poly_a_count_from_truncate = atlas.parse_truncation(args.truncate, selected_indices)
-    
-    # Parse polyA if provided
-    poly_a_pos, poly_a_count = None, None
-    if args.polyA:
-        poly_a_pos, poly_a_count = atlas.parse_poly_a(args.polyA, selected_indices)
-    elif poly_a_count_from_truncate is not None:
-        # If polyA was specified in truncate parameter
-        poly_a_pos = global_end
-        poly_a_count = poly_a_count_from_truncate
-    
-    # Combine selected segments
-    header, sequence = atlas.combine_segments(selected_indices, global_start, global_end, poly_a_pos, poly_a_count)
+    try:
+        # Initialize AtlasWriter
+        atlas = AtlasWriter(args.input)
+        
+        # If --list flag is provided, print segment info and exit
+        if args.list:
+            atlas.print_segment_info()
+            return
+        
+        # Check if segment selection is provided
+        if not args.include_locus_segment:
+            sys.exit("Error: No segment selection provided. Use --include_locus_segment or --list")
+        
+        # Parse segment selection
+        selected_indices = atlas.parse_segment_selection(args.include_locus_segment)
+        cum, pos_of = atlas.segment_offsets(selected_indices)
+        
+        # Parse truncation if provided
+        global_start, global_end, poly_a_count_from_truncate = None, None, None
+        if args.truncate:
+            global_start, global_end, poly_a_count_from_truncate = atlas.parse_truncation(args.truncate, selected_indices, cum, pos_of)
+        
+        # Parse polyA if provided
+        poly_a_pos, poly_a_count = None, None
+        if args.polyA:
+            poly_a_pos, poly_a_count = atlas.parse_poly_a(args.polyA, selected_indices, cum, pos_of)
+        elif poly_a_count_from_truncate is not None:
+            # If polyA was specified in truncate parameter
+            poly_a_pos = global_end
+            poly_a_count = poly_a_count_from_truncate
+        
+        # Combine selected segments
+        header, sequence = atlas.combine_segments(selected_indices, global_start, global_end, poly_a_pos, poly_a_count)
+        
+        # Write output
+        atlas.write_output(header, sequence, args.output)
     
-    # Write output
-    atlas.write_output(header, sequence, args.output)
+    except AtlasWriterError as e:
+        sys.exit(str(e))
 
 
 if __name__ == "__main__":